@@ -9,131 +9,342 @@ Outputs YAML to stdout or file.
 """
 
 import argparse
+import mmap
 import os
 import re
+import sys
+import tempfile
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as Dumper
 
-def extract_claims(project_path: str) -> dict[str, Any]:
-    """Extract claims from a project directory."""
+
+# File extensions to scan
+CODE_EXTENSIONS = ('.py', '.js', '.ts', '.go', '.rs', '.java', '.rb')
+
+# Common non-code directories
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', '__pycache__', '.venv', 'venv',
+    'dist', 'build', '.next', 'target',
+})
+
+# Trees with fewer code files than this are scanned without a process pool
+PARALLEL_MIN_FILES = 256
+
+# Claim patterns: (claim type, pattern, template, confidence).
+# A template of None means the stripped comment text is the statement.
+CLAIM_PATTERNS = [
+    # HTTP status codes
+    ('contract', r'return.*(?:status|status_code)\s*=\s*(\d{3})', 'Returns HTTP {0}', 'high'),
+    ('contract', r'Response\(.*status=(\d{3})', 'Returns HTTP {0}', 'high'),
+    ('contract', r'raise.*(?:Http)?(\d{3})', 'Can raise HTTP {0}', 'high'),
+    # Auth patterns
+    ('contract', r'@(?:require_)?auth|@login_required', 'Requires authentication', 'high'),
+    ('contract', r'if not.*(?:authenticated|logged_in|is_admin)', 'Has authorization check', 'high'),
+    # Validation
+    ('contract', r'raise (?:ValidationError|ValueError)', 'Validates input', 'high'),
+    # Performance comments
+    ('belief', r'#.*(?:fast|slow|performance|optimize|cache)', None, 'medium'),
+    ('belief', r'#.*(?:O\([^)]+\))', None, 'medium'),  # Big O notation
+    # Assumptions
+    ('belief', r'#.*(?:assume|assuming|should be|must be)', None, 'medium'),
+    ('belief', r'#.*(?:typically|usually|most|often)', None, 'medium'),
+    # TODOs and FIXMEs
+    ('spark', r'#\s*TODO:?\s*(.+)', 'TODO: {0}', 'low'),
+    ('spark', r'#\s*FIXME:?\s*(.+)', 'FIXME: {0}', 'low'),
+    ('spark', r'#\s*FUTURE:?\s*(.+)', 'Future: {0}', 'low'),
+]
+
+# Per-pattern regexes, applied in order to each candidate line
+LINE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), claim_type, template, confidence)
+    for claim_type, pattern, template, confidence in CLAIM_PATTERNS
+]
+
+# Every claim pattern starts with one of these characters (#, @, return,
+# raise, Response, if not). Keep in sync with CLAIM_PATTERNS.
+LEADING_CHARS = '#@ri'
+
+# All patterns fused into one bytes alternation, used to find candidate
+# lines in a single scan over the memory-mapped file. The leading-character
+# lookahead lets the engine reject most positions with one class test
+# instead of trying every alternative. Matches are only located here,
+# never read, so the alternatives are non-capturing: group bookkeeping on
+# every attempted alternative makes named groups several times slower.
+MASTER_RE = re.compile(
+    (
+        f'(?=[{LEADING_CHARS}])(?:'
+        + '|'.join(f'(?:{pattern})' for _, pattern, _, _ in CLAIM_PATTERNS)
+        + ')'
+    ).encode(),
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+# Bytes the ASCII-only MASTER_RE can treat differently from the str
+# LINE_PATTERNS: non-ASCII text (Unicode whitespace, digits and case
+# folding) and the separators \x1c-\x1f, which str's \s also matches
+NON_ASCII_RE = re.compile(rb'[\x1c-\x1f\x80-\xff]')
+
+# Line boundaries str.splitlines() recognizes in ASCII text besides \n
+OTHER_BREAK_RE = re.compile(rb'[\r\v\f]')
+
+# Any line boundary, with \r\n as a single break
+LINE_BREAK_RE = re.compile(rb'\r\n|\n|' + OTHER_BREAK_RE.pattern)
+
+
+def _iter_candidate_lines(content: mmap.mmap) -> Iterator[tuple[int, str]]:
+    """Yield (line_num, line) for each line matched by MASTER_RE.
+
+    Lines are numbered as str.splitlines() would number them. Lines
+    without a match are skipped by the regex engine and never decoded.
+    Each candidate line is rechecked against LINE_PATTERNS, so a fused
+    match that spills over a line break is harmless. Files MASTER_RE
+    cannot prefilter exactly yield every line.
+    """
+    if NON_ASCII_RE.search(content) is not None:
+        text = content[:].decode('utf-8', errors='ignore')
+        yield from enumerate(text.splitlines(), 1)
+        return
+
+    if OTHER_BREAK_RE.search(content) is None:
+        yield from _iter_lf_candidate_lines(content)
+        return
+
+    line_num = 1
+    line_start = 0
+    pos = 0
+    while True:
+        match = MASTER_RE.search(content, pos)
+        if match is None:
+            return
+
+        for line_break in LINE_BREAK_RE.finditer(content, line_start, match.start()):
+            line_num += 1
+            line_start = line_break.end()
+        line_break = LINE_BREAK_RE.search(content, match.start())
+        end = len(content) if line_break is None else line_break.start()
+
+        yield line_num, content[line_start:end].decode('utf-8', errors='ignore')
+        if line_break is None:
+            return
+        line_num += 1
+        line_start = pos = line_break.end()
+
+
+def _iter_lf_candidate_lines(content: mmap.mmap) -> Iterator[tuple[int, str]]:
+    """_iter_candidate_lines() for content whose only line break is \n.
+
+    Line boundaries are found with plain byte searches, and lines are
+    counted in C with bytes.count().
+    """
+    line_num = 1
+    line_start = 0
+    pos = 0
+    while True:
+        match = MASTER_RE.search(content, pos)
+        if match is None:
+            return
+
+        start = content.rfind(b'\n', 0, match.start()) + 1
+        end = content.find(b'\n', match.start())
+        if end == -1:
+            end = len(content)
+
+        line_num += content[line_start:start].count(b'\n')
+        line_start = start
+        yield line_num, content[start:end].decode('utf-8', errors='ignore')
+        pos = end + 1
+
+
+def _iter_code_files(directory: str, rel_dir: str = '') -> Iterator[tuple[str, str]]:
+    """Yield (path, relative path) for code files, in os.walk order.
+
+    DirEntry caches the d_type from readdir, so telling files from
+    directories costs no extra stat calls. Symlinked directories are
+    not followed.
+    """
+    subdirs = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name not in SKIP_DIRS and not entry.is_symlink():
+                        subdirs.append((entry.path, os.path.join(rel_dir, entry.name)))
+                elif entry.name.endswith(CODE_EXTENSIONS):
+                    yield entry.path, os.path.join(rel_dir, entry.name)
+    except OSError:
+        return
+
+    for subdir, rel_subdir in subdirs:
+        yield from _iter_code_files(subdir, rel_subdir)
+
+
+def _scan_file(file_path: str, rel_path: str) -> list[tuple[str, str, str, int, str, str]]:
+    """Scan one file and return its claims as records, without ids.
+
+    Records are (type, statement, rel_path, line_num, source_text,
+    confidence) tuples: cheaper to build and to pickle back from worker
+    processes than dicts. iter_claims turns them into claim dicts.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            content = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # ValueError: empty files cannot be mapped
+        return []
+
+    records = []
+    with content:
+        for line_num, line in _iter_candidate_lines(content):
+            for regex, claim_type, template, confidence in LINE_PATTERNS:
+                match = regex.search(line)
+                if match:
+                    if template is None:
+                        statement = line.strip().lstrip('#').strip()
+                    else:
+                        statement = template.format(*match.groups())
+                    records.append(
+                        (claim_type, statement, rel_path, line_num, line.strip(), confidence)
+                    )
+
+    return records
+
+
+def _scan_files(
+    file_paths: list[str], rel_paths: list[str]
+) -> Iterator[list[tuple[str, str, str, int, str, str]]]:
+    """Yield each file's records, in the given order.
+
+    Files are scanned independently, so large trees are spread over a
+    process pool; map() keeps results in walk order so claim ids are
+    assigned exactly as in a sequential scan. Small trees are scanned in
+    this process, where the pool's startup would cost more than it saves.
+    """
+    if len(file_paths) < PARALLEL_MIN_FILES:
+        yield from map(_scan_file, file_paths, rel_paths)
+        return
+
+    with ProcessPoolExecutor() as executor:
+        yield from executor.map(_scan_file, file_paths, rel_paths, chunksize=32)
+
+
+def resolve_project(project_path: str) -> Path:
+    """Resolve a project directory, raising ValueError if it is missing."""
     path = Path(project_path).resolve()
 
     if not path.exists():
         raise ValueError(f"Path does not exist: {path}")
 
-    claims = []
+    return path
+
+
+def iter_claims(path: Path) -> Iterator[dict[str, str]]:
+    """Yield claims from a resolved project directory, in scan order."""
+    file_paths, rel_paths = [], []
+    for file_path, rel_path in _iter_code_files(str(path)):
+        file_paths.append(file_path)
+        rel_paths.append(rel_path)
+
     claim_id = 0
+    for records in _scan_files(file_paths, rel_paths):
+        for claim_type, statement, rel_path, line_num, source_text, confidence in records:
+            claim_id += 1
+            yield {
+                'id': f'{claim_id:03d}',
+                'type': claim_type,
+                'statement': statement,
+                'source_file': f'{rel_path}:{line_num}',
+                'source_text': source_text,
+                'confidence': confidence,
+            }
+
+
+def _source_info(path: Path) -> dict[str, str]:
+    return {
+        'path': str(path),
+        'analyzed': datetime.now().isoformat(),
+    }
 
-    # Patterns for different claim types
-    contract_patterns = [
-        # HTTP status codes
-        (r'return.*(?:status|status_code)\s*=\s*(\d{3})', 'Returns HTTP {0}'),
-        (r'Response\(.*status=(\d{3})', 'Returns HTTP {0}'),
-        (r'raise.*(?:Http)?(\d{3})', 'Can raise HTTP {0}'),
-        # Auth patterns
-        (r'@(?:require_)?auth|@login_required', 'Requires authentication'),
-        (r'if not.*(?:authenticated|logged_in|is_admin)', 'Has authorization check'),
-        # Validation
-        (r'raise (?:ValidationError|ValueError)', 'Validates input'),
-    ]
-
-    belief_patterns = [
-        # Performance comments
-        (r'#.*(?:fast|slow|performance|optimize|cache)', None),
-        (r'#.*(?:O\([^)]+\))', None),  # Big O notation
-        # Assumptions
-        (r'#.*(?:assume|assuming|should be|must be)', None),
-        (r'#.*(?:typically|usually|most|often)', None),
-    ]
-
-    spark_patterns = [
-        # TODOs and FIXMEs
-        (r'#\s*TODO:?\s*(.+)', 'TODO: {0}'),
-        (r'#\s*FIXME:?\s*(.+)', 'FIXME: {0}'),
-        (r'#\s*FUTURE:?\s*(.+)', 'Future: {0}'),
-    ]
-
-    # File extensions to scan
-    code_extensions = {'.py', '.js', '.ts', '.go', '.rs', '.java', '.rb'}
-
-    for root, dirs, files in os.walk(path):
-        # Skip common non-code directories
-        dirs[:] = [d for d in dirs if d not in {
-            '.git', 'node_modules', '__pycache__', '.venv', 'venv',
-            'dist', 'build', '.next', 'target'
-        }]
-
-        for file in files:
-            file_path = Path(root) / file
-
-            if file_path.suffix not in code_extensions:
-                continue
-
-            try:
-                content = file_path.read_text(encoding='utf-8', errors='ignore')
-            except Exception:
-                continue
-
-            rel_path = file_path.relative_to(path)
-
-            for line_num, line in enumerate(content.splitlines(), 1):
-                # Check contract patterns
-                for pattern, template in contract_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        claim_id += 1
-                        statement = template.format(*match.groups()) if template else match.group(0)
-                        claims.append({
-                            'id': f'{claim_id:03d}',
-                            'type': 'contract',
-                            'statement': statement,
-                            'source_file': f'{rel_path}:{line_num}',
-                            'source_text': line.strip(),
-                            'confidence': 'high',
-                        })
-
-                # Check belief patterns
-                for pattern, template in belief_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        claim_id += 1
-                        claims.append({
-                            'id': f'{claim_id:03d}',
-                            'type': 'belief',
-                            'statement': line.strip().lstrip('#').strip(),
-                            'source_file': f'{rel_path}:{line_num}',
-                            'source_text': line.strip(),
-                            'confidence': 'medium',
-                        })
-
-                # Check spark patterns
-                for pattern, template in spark_patterns:
-                    match = re.search(pattern, line, re.IGNORECASE)
-                    if match:
-                        claim_id += 1
-                        statement = template.format(*match.groups()) if template else match.group(0)
-                        claims.append({
-                            'id': f'{claim_id:03d}',
-                            'type': 'spark',
-                            'statement': statement,
-                            'source_file': f'{rel_path}:{line_num}',
-                            'source_text': line.strip(),
-                            'confidence': 'low',
-                        })
+
+def extract_claims(project_path: str) -> dict[str, Any]:
+    """Extract claims from a project directory."""
+    path = resolve_project(project_path)
 
     return {
-        'source': {
-            'path': str(path),
-            'analyzed': datetime.now().isoformat(),
-        },
-        'claims': claims,
+        'source': _source_info(path),
+        'claims': list(iter_claims(path)),
     }
 
 
+def _dump(data: Any) -> str:
+    return yaml.dump(data, Dumper=Dumper, default_flow_style=False, sort_keys=False)
+
+
+def write_claims(path: Path, out: TextIO) -> int:
+    """Stream the claims YAML for a project to out, claim by claim.
+
+    The output is the same document as dumping extract_claims(), but the
+    full claims list is never built: each claim is written as soon as its
+    file has been scanned. Records are still buffered per file, and when a
+    process pool is used every file is submitted up front, so finished
+    files' results can queue up until they are written.
+
+    Returns:
+        The number of claims written.
+    """
+    out.write(_dump({'source': _source_info(path)}))
+
+    count = 0
+    for claim in iter_claims(path):
+        if count == 0:
+            out.write('claims:\n')
+        out.write(_dump([claim]))
+        count += 1
+
+    if count == 0:
+        out.write('claims: []\n')
+
+    return count
+
+
+def _write_claims_file(path: Path, output: str) -> int:
+    """Write the claims YAML to output, replacing it only once complete.
+
+    Claims go to a temporary file in the same directory, which is moved
+    into place with os.replace(), so a failed scan leaves any previous
+    output untouched. The file gets the permissions open() would give it.
+    """
+    try:
+        mode = os.stat(output).st_mode & 0o777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        mode = 0o666 & ~umask
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=os.path.dirname(os.path.abspath(output)), suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'w') as out:
+            count = write_claims(path, out)
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, output)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return count
+
+
 def main():
     parser = argparse.ArgumentParser(description='Extract claims from codebase')
     parser.add_argument('project_path', help='Path to project directory')
@@ -141,20 +352,19 @@ def main():
     args = parser.parse_args()
 
     try:
-        result = extract_claims(args.project_path)
+        path = resolve_project(args.project_path)
     except ValueError as e:
         print(f"Error: {e}")
         return 1
 
-    yaml_output = yaml.dump(result, default_flow_style=False, sort_keys=False)
-
     if args.output:
-        Path(args.output).write_text(yaml_output)
+        count = _write_claims_file(path, args.output)
         print(f"Claims written to {args.output}")
     else:
-        print(yaml_output)
+        count = write_claims(path, sys.stdout)
+        print()
 
-    print(f"\nFound {len(result['claims'])} claims", file=__import__('sys').stderr)
+    print(f"\nFound {count} claims", file=sys.stderr)
     return 0
 
 
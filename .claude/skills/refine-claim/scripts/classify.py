@@ -11,8 +11,136 @@ Output:
 
 import re
 import sys
-
-
+from functools import lru_cache
+
+
+def _compile(*patterns: str) -> tuple[re.Pattern[str], ...]:
+    """Compile patterns once at import; IGNORECASE replaces claim.lower()."""
+    return tuple(re.compile(p, re.IGNORECASE) for p in patterns)
+
+
+def _fuse(patterns: tuple[re.Pattern[str], ...]) -> re.Pattern[str]:
+    """Fuse a class's patterns into one alternation for a single scan."""
+    return re.compile("|".join(f"(?:{p.pattern})" for p in patterns), re.IGNORECASE)
+
+
+# Equality indicators: comparisons, return values, expected outputs
+_EQUALITY_RE = _compile(
+    r"\b(returns?|equals?|outputs?|produces?)\b",
+    r"\b(status\s*code|http\s*\d{3}|4\d{2}|5\d{2}|2\d{2})\b",
+    r"\b(should|must|will)\s+(return|equal|output|be)\b",
+    r"\b(result|response|value)\s+(is|equals?|==)\b",
+    r"\b(expected|actual)\b",
+    r"==|!=|\.equals?\(",
+)
+
+# Invariant indicators: constraints that must always hold
+_INVARIANT_RE = _compile(
+    r"\b(always|never|must\s+hold|guaranteed)\b",
+    r"\b(>=|<=|>|<)\s*\d+",
+    r"\b(bound|limit|constraint|threshold)\b",
+    r"\b(improves?|reduces?|increases?|decreases?)\b.*\b(by|to)\b",
+    r"\b(\d+%|\d+x|faster|slower)\b",
+    r"\b(performance|latency|throughput|memory)\b",
+    r"\b(non-?negative|positive|within)\b",
+)
+
+# Membership indicators: set membership, validation
+_MEMBERSHIP_RE = _compile(
+    r"\b(is\s+(a|an|one\s+of|valid|in))\b",
+    r"\b(belongs?\s+to|member\s+of|contains?)\b",
+    r"\b(valid|invalid|allowed|forbidden)\b",
+    r"\b(enum|set|list|collection)\b",
+    r"\b(matches?|pattern|format|type)\b",
+    r"\b(role|permission|category)\b",
+)
+
+# Ordering indicators: comparison relationships
+_ORDERING_RE = _compile(
+    r"\b(sorted|ordered|ranked|priorit)\b",
+    r"\b(before|after|precedes?|follows?)\b",
+    r"\b(first|last|next|previous)\b",
+    r"\b(ascending|descending|sequence)\b",
+    r"\b(greater|lesser|higher|lower)\s+than\b",
+    r"\b(heap|queue|stack)\b",
+)
+
+# Grounding indicators: evidence and attribution
+_GROUNDING_RE = _compile(
+    r"\b(supported\s+by|derived\s+from|based\s+on)\b",
+    r"\b(evidence|source|reference|citation)\b",
+    r"\b(documented|traced|attributed)\b",
+    r"\b(coverage|tested|verified)\b",
+    r"\b(matches?\s+(implementation|spec|docs?))\b",
+)
+
+# Feasibility indicators: can it work questions
+_FEASIBILITY_RE = _compile(
+    r"\b(can\s+we|could\s+we|is\s+it\s+possible)\b",
+    r"\b(feasible|viable|achievable|doable)\b",
+    r"\b(predict|detect|identify|recognize|infer)\b",
+    r"\b(build|create|implement)\b.*\b(that|which|to)\b",
+    r"\b(poc|proof\s+of\s+concept|prototype)\b",
+    r"\b(idea|concept|approach|technique)\b",
+)
+
+# Literal prefilter: every pattern in a class needs at least one of these
+# words as a token. None means the class has symbolic or numeric patterns
+# (==, >=, 404, 30%) and must always be scanned.
+KEYWORDS: dict[str, frozenset[str] | None] = {
+    "equality": None,
+    "invariant": None,
+    "membership": frozenset({
+        "is", "belong", "belongs", "member", "contain", "contains",
+        "valid", "invalid", "allowed", "forbidden",
+        "enum", "set", "list", "collection",
+        "match", "matches", "pattern", "format", "type",
+        "role", "permission", "category",
+    }),
+    "ordering": frozenset({
+        "sorted", "ordered", "ranked", "priorit",
+        "before", "after", "precede", "precedes", "follow", "follows",
+        "first", "last", "next", "previous",
+        "ascending", "descending", "sequence",
+        "greater", "lesser", "higher", "lower",
+        "heap", "queue", "stack",
+    }),
+    "grounding": frozenset({
+        "supported", "derived", "based",
+        "evidence", "source", "reference", "citation",
+        "documented", "traced", "attributed",
+        "coverage", "tested", "verified",
+        "match", "matches",
+    }),
+    "feasibility": frozenset({
+        "can", "could", "possible",
+        "feasible", "viable", "achievable", "doable",
+        "predict", "detect", "identify", "recognize", "infer",
+        "build", "create", "implement",
+        "poc", "proof", "prototype",
+        "idea", "concept", "approach", "technique",
+    }),
+}
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# (type, keywords, fused class regex, individual patterns). The fused regex
+# rejects a class in one scan; individual patterns are only scored on a hit,
+# so each distinct pattern still counts exactly once.
+PATTERN_SETS = tuple(
+    (prop_type, KEYWORDS[prop_type], _fuse(patterns), patterns)
+    for prop_type, patterns in (
+        ("equality", _EQUALITY_RE),
+        ("invariant", _INVARIANT_RE),
+        ("membership", _MEMBERSHIP_RE),
+        ("ordering", _ORDERING_RE),
+        ("grounding", _GROUNDING_RE),
+        ("feasibility", _FEASIBILITY_RE),
+    )
+)
+
+
+@lru_cache(maxsize=4096)
 def classify_claim(claim: str) -> str:
     """
     Classify a claim by property type:
@@ -23,68 +151,6 @@ def classify_claim(claim: str) -> str:
     - grounding: X supported by Y (attribution)
     - feasibility: Can X work? (new ideas, POCs)
     """
-    claim_lower = claim.lower()
-
-    # Equality indicators: comparisons, return values, expected outputs
-    equality_patterns = [
-        r"\b(returns?|equals?|outputs?|produces?)\b",
-        r"\b(status\s*code|http\s*\d{3}|4\d{2}|5\d{2}|2\d{2})\b",
-        r"\b(should|must|will)\s+(return|equal|output|be)\b",
-        r"\b(result|response|value)\s+(is|equals?|==)\b",
-        r"\b(expected|actual)\b",
-        r"==|!=|\.equals?\(",
-    ]
-
-    # Invariant indicators: constraints that must always hold
-    invariant_patterns = [
-        r"\b(always|never|must\s+hold|guaranteed)\b",
-        r"\b(>=|<=|>|<)\s*\d+",
-        r"\b(bound|limit|constraint|threshold)\b",
-        r"\b(improves?|reduces?|increases?|decreases?)\b.*\b(by|to)\b",
-        r"\b(\d+%|\d+x|faster|slower)\b",
-        r"\b(performance|latency|throughput|memory)\b",
-        r"\b(non-?negative|positive|within)\b",
-    ]
-
-    # Membership indicators: set membership, validation
-    membership_patterns = [
-        r"\b(is\s+(a|an|one\s+of|valid|in))\b",
-        r"\b(belongs?\s+to|member\s+of|contains?)\b",
-        r"\b(valid|invalid|allowed|forbidden)\b",
-        r"\b(enum|set|list|collection)\b",
-        r"\b(matches?|pattern|format|type)\b",
-        r"\b(role|permission|category)\b",
-    ]
-
-    # Ordering indicators: comparison relationships
-    ordering_patterns = [
-        r"\b(sorted|ordered|ranked|priorit)\b",
-        r"\b(before|after|precedes?|follows?)\b",
-        r"\b(first|last|next|previous)\b",
-        r"\b(ascending|descending|sequence)\b",
-        r"\b(greater|lesser|higher|lower)\s+than\b",
-        r"\b(heap|queue|stack)\b",
-    ]
-
-    # Grounding indicators: evidence and attribution
-    grounding_patterns = [
-        r"\b(supported\s+by|derived\s+from|based\s+on)\b",
-        r"\b(evidence|source|reference|citation)\b",
-        r"\b(documented|traced|attributed)\b",
-        r"\b(coverage|tested|verified)\b",
-        r"\b(matches?\s+(implementation|spec|docs?))\b",
-    ]
-
-    # Feasibility indicators: can it work questions
-    feasibility_patterns = [
-        r"\b(can\s+we|could\s+we|is\s+it\s+possible)\b",
-        r"\b(feasible|viable|achievable|doable)\b",
-        r"\b(predict|detect|identify|recognize|infer)\b",
-        r"\b(build|create|implement)\b.*\b(that|which|to)\b",
-        r"\b(poc|proof\s+of\s+concept|prototype)\b",
-        r"\b(idea|concept|approach|technique)\b",
-    ]
-
     # Score each type
     scores = {
         "equality": 0,
@@ -95,18 +161,15 @@ def classify_claim(claim: str) -> str:
         "feasibility": 0,
     }
 
-    pattern_sets = [
-        ("equality", equality_patterns),
-        ("invariant", invariant_patterns),
-        ("membership", membership_patterns),
-        ("ordering", ordering_patterns),
-        ("grounding", grounding_patterns),
-        ("feasibility", feasibility_patterns),
-    ]
+    tokens = set(_TOKEN_RE.findall(claim.casefold()))
 
-    for prop_type, patterns in pattern_sets:
+    for prop_type, keywords, fused, patterns in PATTERN_SETS:
+        if keywords is not None and keywords.isdisjoint(tokens):
+            continue
+        if not fused.search(claim):
+            continue
         for pattern in patterns:
-            if re.search(pattern, claim_lower):
+            if pattern.search(claim):
                 scores[prop_type] += 1
 
     # Return highest scoring type
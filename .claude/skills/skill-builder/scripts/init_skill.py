@@ -74,6 +74,13 @@ TODO: Examples.
 '''
 
 
+def render(template: str, **values: str) -> str:
+    """Fill {key} placeholders by plain substitution, skipping format parsing."""
+    for key, value in values.items():
+        template = template.replace('{' + key + '}', value)
+    return template
+
+
 def init_skill(name: str, base_path: str = '.') -> None:
     """Initialize a new skill directory."""
     base = Path(base_path)
@@ -90,17 +97,17 @@ def init_skill(name: str, base_path: str = '.') -> None:
 
     # Create SKILL.md
     title = name.replace('-', ' ').title()
-    skill_content = SKILL_TEMPLATE.format(name=name, title=title)
+    skill_content = render(SKILL_TEMPLATE, name=name, title=title)
     (skill_dir / 'SKILL.md').write_text(skill_content)
 
     # Create example script
-    script_content = SCRIPT_TEMPLATE.format(name='example')
+    script_content = render(SCRIPT_TEMPLATE, name='example')
     script_path = skill_dir / 'scripts' / 'example.py'
     script_path.write_text(script_content)
     script_path.chmod(0o755)
 
     # Create example reference
-    ref_content = REFERENCE_TEMPLATE.format(title='Patterns')
+    ref_content = render(REFERENCE_TEMPLATE, title='Patterns')
     (skill_dir / 'references' / 'patterns.md').write_text(ref_content)
 
     # Create .gitkeep in assets
@@ -13,12 +13,37 @@ Checks:
 """
 
 import argparse
+import os
 import re
+import stat
 import sys
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as Loader
+
+
+def _list_dir(directory: Path) -> dict[str, os.DirEntry]:
+    """Map entry names to DirEntry objects, or {} if the directory can't be listed."""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        # Missing, not a directory, or unreadable: like the old glob(), see nothing
+        return {}
+
+
+def _mentioned_exists(directory: Path, entries: dict[str, os.DirEntry], name: str) -> bool:
+    """Check a mentioned file against a directory listing."""
+    if '/' in name:
+        # Nested paths are not in the listing; fall back to a stat
+        return (directory / name).exists()
+    return name in entries
+
 
 def validate_skill(skill_path: str) -> list[str]:
     """Validate a skill directory, return list of errors."""
@@ -26,29 +51,29 @@ def validate_skill(skill_path: str) -> list[str]:
     errors = []
 
     # Check directory exists
-    if not path.exists():
+    try:
+        mode = path.stat().st_mode
+    except OSError:
         return [f"Path does not exist: {path}"]
 
-    if not path.is_dir():
+    if not stat.S_ISDIR(mode):
         return [f"Not a directory: {path}"]
 
-    # Check SKILL.md exists
-    skill_md = path / 'SKILL.md'
-    if not skill_md.exists():
+    # Check SKILL.md exists and parse it
+    try:
+        content = (path / 'SKILL.md').read_text()
+    except FileNotFoundError:
         errors.append("Missing SKILL.md")
         return errors
 
-    # Parse SKILL.md
-    content = skill_md.read_text()
-
-    # Extract frontmatter
-    frontmatter_match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-    if not frontmatter_match:
+    # Extract frontmatter: "---\n" at offset 0, closed by the next "\n---"
+    frontmatter_end = content.find('\n---', 4) if content.startswith('---\n') else -1
+    if frontmatter_end == -1:
         errors.append("SKILL.md missing YAML frontmatter")
         return errors
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_match.group(1))
+        frontmatter = yaml.load(content[4:frontmatter_end], Loader=Loader)
     except yaml.YAMLError as e:
         errors.append(f"Invalid YAML frontmatter: {e}")
         return errors
@@ -62,29 +87,28 @@ def validate_skill(skill_path: str) -> list[str]:
     elif 'TODO' in frontmatter.get('description', ''):
         errors.append("Description contains TODO - needs to be filled in")
 
-    # Check scripts are executable
+    # Check scripts are executable (one scandir pass, stat only .py files)
     scripts_dir = path / 'scripts'
-    if scripts_dir.exists():
-        for script in scripts_dir.glob('*.py'):
-            if not script.stat().st_mode & 0o111:
-                errors.append(f"Script not executable: {script.name}")
+    scripts = _list_dir(scripts_dir)
+    for name in sorted(scripts):
+        if name.endswith('.py') and not scripts[name].stat().st_mode & 0o111:
+            errors.append(f"Script not executable: {name}")
 
     # Check mentioned references exist
-    body = content[frontmatter_match.end():]
+    body = content[frontmatter_end + 4:]
     ref_mentions = re.findall(r'`references/([^`]+)`', body)
     refs_dir = path / 'references'
+    refs = _list_dir(refs_dir)
 
     for ref in ref_mentions:
-        ref_path = refs_dir / ref
-        if not ref_path.exists():
+        if not _mentioned_exists(refs_dir, refs, ref):
             errors.append(f"Referenced file missing: references/{ref}")
 
     # Check mentioned scripts exist
     script_mentions = re.findall(r'`scripts/([^`]+)`', body)
 
     for script in script_mentions:
-        script_path = scripts_dir / script
-        if not script_path.exists():
+        if not _mentioned_exists(scripts_dir, scripts, script):
             errors.append(f"Referenced script missing: scripts/{script}")
 
     return errors
@@ -15,6 +15,11 @@ from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as Loader
+
 
 def create_notebook(experiment_dir: str) -> None:
     """Generate experiment.ipynb from claims.yaml."""
@@ -27,16 +32,17 @@ def create_notebook(experiment_dir: str) -> None:
         sys.exit(1)
 
     with open(claims_file) as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=Loader)
 
     cells = []
+    experiment = data.get('experiment', {})
 
     # Title cell
-    exp_name = data.get('experiment', {}).get('name', 'Experiment')
+    exp_name = experiment.get('name', 'Experiment')
     cells.append(markdown_cell(f"# {exp_name}\n\n**Created:** {datetime.now().isoformat()}"))
 
     # Overview cell
-    source = data.get('experiment', {}).get('source', 'Unknown')
+    source = experiment.get('source', 'Unknown')
     cells.append(markdown_cell(f"## Overview\n\n**Source:** {source}"))
 
     # Claims section
@@ -121,7 +127,7 @@ def markdown_cell(content: str) -> dict:
     return {
         "cell_type": "markdown",
         "metadata": {},
-        "source": content.split('\n')
+        "source": content
     }
 
 
@@ -130,7 +136,7 @@ def code_cell(content: str) -> dict:
     return {
         "cell_type": "code",
         "metadata": {},
-        "source": content.split('\n'),
+        "source": content,
         "outputs": [],
         "execution_count": None
     }
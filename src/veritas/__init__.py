@@ -38,7 +38,7 @@ from veritas import claim, Analytic
 def test_addition():
     with claim(Analytic("2+2=4", lhs="result", rhs=4)) as c:
         c.bind(result=2+2)
-    assert c.result.verdict.name == "SURVIVED"
+    assert c.result.survived
 ```
 """
 
@@ -50,7 +50,15 @@ from .extensions import (
     InvariantCheck,
     ModelAccuracy,
 )
-from .falsification import ClaimContext, claim, falsify, quick_check, verified
+from .falsification import (
+    ClaimContext,
+    claim,
+    falsify,
+    falsify_batch,
+    quick_check,
+    verified,
+)
+from .symbolic import sym
 from .truth import Analytic, Empirical, FalsificationForm, Modal, Probabilistic, Truth
 
 __all__ = [
@@ -67,11 +75,14 @@ __all__ = [
     "VerdictResult",
     # Falsification
     "falsify",
+    "falsify_batch",
     "quick_check",
     # Testing API
     "claim",
     "verified",
     "ClaimContext",
+    # Symbolic helpers
+    "sym",
     # Extensions
     "DomainTruth",
     "HTTPResponse",
@@ -12,10 +12,9 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import TYPE_CHECKING, Any
 
-import sympy as sp
-
-
 if TYPE_CHECKING:
+    import sympy as sp
+
     from .truth import FalsificationForm
 
 
@@ -32,10 +31,10 @@ class Verdict(Enum):
     UNCERTAIN = "UNCERTAIN"
 
     def __str__(self) -> str:
-        return self.value
+        return self._value_  # plain attribute, skips the Enum.value descriptor
 
 
-@dataclass
+@dataclass(slots=True)
 class Evidence:
     """Concrete evidence for falsification.
 
@@ -65,10 +64,12 @@ class Evidence:
         Returns:
             Dict mapping SymPy Symbols to their bound values.
         """
-        return {sp.Symbol(name): value for name, value in self.bindings.items()}
+        from .symbolic import sym  # SymPy is only needed from here on
+
+        return {sym(name): value for name, value in self.bindings.items()}
 
 
-@dataclass
+@dataclass(slots=True)
 class VerdictResult:
     """The complete result of a verification attempt.
 
@@ -94,6 +95,21 @@ class VerdictResult:
     reasoning: str = ""
     """Human-readable explanation of why this verdict was reached."""
 
+    @property
+    def survived(self) -> bool:
+        """Whether the claim held up against the evidence."""
+        return self.verdict is Verdict.SURVIVED
+
+    @property
+    def killed(self) -> bool:
+        """Whether the evidence falsified the claim."""
+        return self.verdict is Verdict.KILLED
+
+    @property
+    def uncertain(self) -> bool:
+        """Whether the verification was inconclusive."""
+        return self.verdict is Verdict.UNCERTAIN
+
     def add_trace(self, step: str) -> None:
         """Add a step to the trace."""
         self.trace.append(step)
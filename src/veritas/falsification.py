@@ -2,6 +2,7 @@
 
 This module provides:
 - falsify(): verify a truth against evidence
+- falsify_batch(): verify a truth against many pieces of evidence
 - quick_check(): convenience for simple cases
 - claim(): context manager for inline verification
 - verified(): decorator for test functions
@@ -13,11 +14,14 @@ from __future__ import annotations
 import functools
 from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Callable, Generator, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generator, Iterable, TypeVar
 
 import sympy as sp
+from sympy.logic.boolalg import BooleanAtom
 
 from .evidence import Evidence, Verdict, VerdictResult
+from .symbolic import decide, simplify, substitute
+from .truth import Analytic, Empirical, Probabilistic
 
 if TYPE_CHECKING:
     from .truth import FalsificationForm, Truth
@@ -31,27 +35,50 @@ F = TypeVar("F", bound=Callable[..., Any])
 
 
 def _substitute(form: FalsificationForm, evidence: Evidence) -> sp.Basic:
-    """Substitute evidence bindings into a falsification form."""
-    formula = form.formula
-    for symbol, value in evidence.to_sympy().items():
-        formula = formula.subs(symbol, value)
-    return formula
+    """Substitute evidence bindings into a falsification form.
 
+    The mapping is built straight from the bindings, without an
+    intermediate to_sympy() dict.
+    """
+    return substitute(form.formula, evidence.bindings)
+
+
+_UNEVALUATED = (sp.Derivative, sp.Integral, sp.Sum, sp.Product)
+"""Operations that doit() evaluates far more cheaply than sp.simplify."""
 
+
+@functools.lru_cache(maxsize=4096)
 def _evaluate(substituted: sp.Basic) -> bool | None:
     """Evaluate a substituted formula to a boolean.
 
+    Concrete formulas are decided structurally (after doit() if they hold
+    unevaluated operations); only the rest go through sp.simplify. Results
+    are memoized on the formula, so repeated verifications of the same
+    claim shape skip evaluation entirely.
+
     Returns:
         True if the falsification condition is met (claim KILLED).
         False if the condition is not met (claim SURVIVED).
         None if the result cannot be determined.
     """
-    simplified = sp.simplify(substituted)
+    decided = decide(substituted)
+    if decided is not None:
+        return decided
 
-    if simplified is sp.true or simplified == True:  # noqa: E712
-        return True
-    if simplified is sp.false or simplified == False:  # noqa: E712
-        return False
+    # Unevaluated derivatives/integrals usually just need evaluating
+    if substituted.has(*_UNEVALUATED):
+        decided = decide(substituted.doit())
+        if decided is not None:
+            return decided
+
+    simplified = simplify(substituted)
+
+    if isinstance(simplified, BooleanAtom):
+        return bool(simplified)
+
+    # Anything still mentioning a free symbol cannot be decided
+    if simplified.free_symbols:
+        return None
 
     if hasattr(simplified, 'is_Boolean') and simplified.is_Boolean:
         try:
@@ -61,26 +88,150 @@ def _evaluate(substituted: sp.Basic) -> bool | None:
 
     try:
         if isinstance(simplified, sp.Equality):
-            lhs_val, rhs_val = simplified.lhs, simplified.rhs
-            if not lhs_val.free_symbols and not rhs_val.free_symbols:
-                return bool(lhs_val.equals(rhs_val))
+            return bool(simplified.lhs.equals(simplified.rhs))
 
         if isinstance(simplified, sp.Ne):
-            lhs_val, rhs_val = simplified.lhs, simplified.rhs
-            if not lhs_val.free_symbols and not rhs_val.free_symbols:
-                return not bool(lhs_val.equals(rhs_val))
+            return not bool(simplified.lhs.equals(simplified.rhs))
 
         if isinstance(simplified, sp.Rel):
-            lhs_val, rhs_val = simplified.lhs, simplified.rhs
-            if not lhs_val.free_symbols and not rhs_val.free_symbols:
-                return bool(simplified)
+            return bool(simplified)
     except (TypeError, ValueError, AttributeError):
         pass
 
     return None
 
 
-def falsify(truth: Truth, evidence: Evidence) -> VerdictResult:
+def _same_type_not_equal(actual: Any, expected: Any) -> bool | None:
+    """Compare plain values, but only of the same type.
+
+    Mixed numeric types go through SymPy, whose comparison differs from
+    Python's for large values (and treats True as distinct from 1).
+    """
+    if type(actual) is not type(expected):
+        return None
+    return bool(actual != expected)
+
+
+def _sympy_not_equal(actual: sp.Basic, expected: Any) -> bool | None:
+    """Compare a SymPy value the way the substituted Ne() formula would."""
+    relation = sp.Ne(actual, expected)
+    if relation is sp.true:
+        return True
+    if relation is sp.false:
+        return False
+    return None
+
+
+_NOT_EQUAL: dict[type, Callable[[Any, Any], bool | None]] = {
+    int: _same_type_not_equal,
+    float: _same_type_not_equal,
+    bool: _same_type_not_equal,
+}
+"""Comparators for evidence values, keyed by the value's exact type."""
+
+
+def _not_equal(actual: Any, expected: Any) -> bool | None:
+    """Decide actual ≠ expected, or return None to defer to substitution."""
+    compare = _NOT_EQUAL.get(type(actual))
+    if compare is None:
+        if not isinstance(actual, sp.Basic):
+            return None
+        compare = _sympy_not_equal
+    return compare(actual, expected)
+
+
+Evaluator = Callable[[Evidence], bool | None]
+"""Decides one truth against evidence without SymPy; None defers to SymPy."""
+
+
+def _analytic_evaluator(truth: Analytic) -> Evaluator | None:
+    """Specialize direct comparison of the bound value for one Analytic truth."""
+    lhs, expected = truth.lhs, truth.rhs
+    if not isinstance(lhs, str):
+        return None
+
+    def evaluate(evidence: Evidence) -> bool | None:
+        # The form may not mention lhs at all (e.g. rhs is a set), so the
+        # missing-evidence check cannot be relied on to have bound it
+        bindings = evidence.bindings
+        if lhs not in bindings:
+            return None
+        return _not_equal(bindings[lhs], expected)
+
+    return evaluate
+
+
+def _probabilistic_evaluator(truth: Probabilistic) -> Evaluator:
+    """Specialize the threshold comparison for one Probabilistic truth."""
+    metric, threshold_type = truth.metric, type(truth.threshold)
+    check_threshold = truth.check_threshold
+
+    def evaluate(evidence: Evidence) -> bool | None:
+        value = evidence.bindings[metric]
+        if type(value) is not threshold_type or threshold_type not in (int, float):
+            return None
+        return not check_threshold(value)
+
+    return evaluate
+
+
+def _empirical_evaluator(truth: Empirical) -> Evaluator | None:
+    """Decide an Empirical claim by applying its predicate to the observation.
+
+    The symbolic form, Contradicts(observation), can never be evaluated, so
+    without a predicate the claim stays UNCERTAIN. So does an observation
+    the predicate fails on: user code must not crash the verifier.
+    """
+    if truth.expected_predicate is None:
+        return None
+    observation_var, check_observation = truth.observation_var, truth.check_observation
+
+    def evaluate(evidence: Evidence) -> bool | None:
+        try:
+            return not check_observation(evidence.bindings[observation_var])
+        except Exception:
+            return None
+
+    return evaluate
+
+
+def _compiled_evaluator(form: FalsificationForm) -> Evaluator | None:
+    """Evaluate any form through its compiled predicate, if it has one."""
+    predicate = form.compile()
+    if predicate is None:
+        return None
+    return lambda evidence: predicate(evidence.bindings)
+
+
+_DIRECT_EVALUATORS: dict[type, Callable[[Any], Evaluator | None]] = {
+    Analytic: _analytic_evaluator,
+    Empirical: _empirical_evaluator,
+    Probabilistic: _probabilistic_evaluator,
+}
+"""Truth types with a specialized SymPy-free evaluator, keyed by exact type."""
+
+
+def _direct_evaluator(truth: Truth, form: FalsificationForm) -> Evaluator | None:
+    """Build the SymPy-free evaluator for a truth and its form, if any.
+
+    Types without a specialized evaluator (Modal, user-defined truths) use
+    the form's compiled predicate.
+    """
+    specialize = _DIRECT_EVALUATORS.get(type(truth))
+    if specialize is not None:
+        return specialize(truth)
+    return _compiled_evaluator(form)
+
+
+_OUTCOMES: dict[bool | None, tuple[Verdict, str]] = {
+    True: (Verdict.KILLED, "Falsification condition met: {description}"),
+    False: (Verdict.SURVIVED, "Falsification condition not met with given evidence"),
+    None: (Verdict.UNCERTAIN, "Could not evaluate formula: {formula}"),
+}
+"""Verdict and reasoning template for each evaluation result."""
+
+
+def falsify(truth: Truth, evidence: Evidence, *, trace: bool = True) -> VerdictResult:
     """Verify a truth against evidence.
 
     This is the main entry point. It constructs the falsification form,
@@ -89,53 +240,86 @@ def falsify(truth: Truth, evidence: Evidence) -> VerdictResult:
     Args:
         truth: The truth to verify.
         evidence: Evidence to test against.
+        trace: Record the step-by-step trace. Callers that only need the
+            verdict can pass False to skip formatting it.
 
     Returns:
         VerdictResult with verdict, trace, and reasoning.
     """
-    result = VerdictResult(
-        verdict=Verdict.UNCERTAIN,
-        trace=[],
-        reasoning="",
-    )
+    form = truth.falsify()
+    return _falsify(truth, form, evidence, trace, _direct_evaluator(truth, form))
 
-    # Step 1: Get falsification form
-    result.add_trace(f"Constructing falsification form for: {truth.statement}")
+
+def falsify_batch(
+    truth: Truth,
+    evidences: Iterable[Evidence],
+    *,
+    trace: bool = True,
+) -> list[VerdictResult]:
+    """Verify one truth against many pieces of evidence.
+
+    Equivalent to calling falsify() once per evidence, but the falsification
+    form (and any SymPy-free evaluator for the truth) is constructed once and
+    shared by every result.
+
+    Args:
+        truth: The truth to verify.
+        evidences: Evidence to test against, one verification each.
+        trace: Record the step-by-step trace on each result.
+
+    Returns:
+        One VerdictResult per evidence, in order.
+    """
     form = truth.falsify()
-    result.form = form
-    result.add_trace(f"Falsification form: {form.description}")
+    direct = _direct_evaluator(truth, form)
+    return [_falsify(truth, form, evidence, trace, direct) for evidence in evidences]
+
+
+def _falsify(
+    truth: Truth,
+    form: FalsificationForm,
+    evidence: Evidence,
+    trace: bool = True,
+    direct: Evaluator | None = None,
+) -> VerdictResult:
+    """Verify a truth against evidence using an already-built form."""
+    result = VerdictResult(verdict=Verdict.UNCERTAIN, form=form, evidence=evidence)
+
+    # Step 1: Get falsification form
+    if trace:
+        result.add_trace(f"Constructing falsification form for: {truth.statement}")
+        result.add_trace(f"Falsification form: {form.description}")
 
     # Step 2: Check evidence completeness
-    result.add_trace(f"Evidence bindings: {evidence.bindings}")
-    result.evidence = evidence
-
-    missing = {
-        symbol.name
-        for symbol in form.free_symbols
-        if symbol.name not in evidence.bindings
-    }
+    if trace:
+        result.add_trace(f"Evidence bindings: {evidence.bindings}")
+
+    missing = form.free_symbol_names - evidence.bindings.keys()
     if missing:
         result.reasoning = f"Missing evidence for: {missing}"
-        result.add_trace(f"Cannot evaluate: missing {missing}")
+        if trace:
+            result.add_trace(f"Cannot evaluate: missing {missing}")
         return result
 
     # Step 3: Substitute and evaluate
-    substituted = _substitute(form, evidence)
-    result.add_trace(f"Substituted formula: {substituted}")
-
-    eval_result = _evaluate(substituted)
-    result.add_trace(f"Evaluation result: {eval_result}")
+    substituted: sp.Basic | None = None
+    eval_result = direct(evidence) if direct is not None else None
+    if eval_result is not None:
+        if trace:
+            result.add_trace("Evaluated bindings directly, without substitution")
+    else:
+        substituted = _substitute(form, evidence)
+        eval_result = _evaluate(substituted)
+        if trace:
+            result.add_trace(f"Substituted formula: {substituted}")
+    if trace:
+        result.add_trace(f"Evaluation result: {eval_result}")
 
     # Step 4: Determine verdict
-    if eval_result is True:
-        result.verdict = Verdict.KILLED
-        result.reasoning = f"Falsification condition met: {form.description}"
-    elif eval_result is False:
-        result.verdict = Verdict.SURVIVED
-        result.reasoning = "Falsification condition not met with given evidence"
-    else:
-        result.verdict = Verdict.UNCERTAIN
-        result.reasoning = f"Could not evaluate formula: {substituted}"
+    result.verdict, reasoning = _OUTCOMES[eval_result]
+    result.reasoning = reasoning.format(
+        description=form.description, formula=substituted
+    )
 
     return result
 
@@ -151,7 +335,7 @@ def quick_check(truth: Truth, **bindings: Any) -> Verdict:
         Just the Verdict (KILLED, SURVIVED, or UNCERTAIN).
     """
     evidence = Evidence(bindings=bindings)
-    return falsify(truth, evidence).verdict
+    return falsify(truth, evidence, trace=False).verdict
 
 
 # ---------------------------------------------------------------------------
@@ -159,7 +343,7 @@ def quick_check(truth: Truth, **bindings: Any) -> Verdict:
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class ClaimContext:
     """Context for tracking claims within a test.
 
@@ -199,7 +383,7 @@ def claim(truth: Truth) -> Generator[ClaimContext, None, None]:
         >>> def test_addition():
         ...     with claim(Analytic("2+2=4", lhs="result", rhs=4)) as c:
         ...         c.bind(result=2+2)
-        ...     assert c.result.verdict == Verdict.SURVIVED
+        ...     assert c.result.survived
 
     Yields:
         ClaimContext for adding evidence. Automatically verifies on exit.
@@ -211,22 +395,32 @@ def claim(truth: Truth) -> Generator[ClaimContext, None, None]:
         ctx.result = falsify(ctx.truth, ctx.evidence)
 
 
-def verified(truth_factory: Callable[..., Truth]) -> Callable[[F], F]:
+def verified(
+    truth_factory: Callable[..., Truth], *, cache_truth: bool = True
+) -> Callable[[F], F]:
     """Decorator to mark a test as verified by Veritas.
 
     The decorated function should return evidence bindings as a dict.
     The test passes if the claim SURVIVES and fails if KILLED.
 
+    Args:
+        truth_factory: Builds the truth to verify.
+        cache_truth: Build the truth once, on the first call, and reuse it
+            (and its falsification form) afterwards. Pass False for
+            factories whose truth depends on state that changes between
+            calls.
+
     Example:
         >>> @verified(lambda: Analytic("2+2=4", lhs="result", rhs=4))
         ... def test_addition():
         ...     return {"result": 2 + 2}
     """
+    make_truth = functools.cache(truth_factory) if cache_truth else truth_factory
 
     def decorator(func: F) -> F:
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> VerdictResult:
-            truth = truth_factory()
+            truth = make_truth()
 
             bindings = func(*args, **kwargs)
 
@@ -242,7 +436,7 @@ def verified(truth_factory: Callable[..., Truth]) -> Callable[[F], F]:
 
             result = falsify(truth, evidence)
 
-            if result.verdict == Verdict.KILLED:
+            if result.killed:
                 raise AssertionError(
                     f"Claim KILLED: {truth.statement}\n"
                     f"Reasoning: {result.reasoning}\n"
@@ -0,0 +1,110 @@
+"""Shared SymPy helpers for Veritas.
+
+This module provides:
+- sym(): interned SymPy symbol construction
+- simplify(): memoized sp.simplify for substituted formulas
+- substitute(): single-pass substitution of named bindings
+- decide(): structural truth value of a concrete formula
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING, Any
+
+import sympy as sp
+from sympy.logic.boolalg import BooleanAtom
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+@functools.cache
+def sym(name: str) -> sp.Symbol:
+    """Return the SymPy symbol for a name, reusing previously built ones.
+
+    sp.Symbol() goes through the assumptions machinery on every call;
+    evidence bindings and truth constructors ask for the same few names
+    over and over. The cache is a plain unbounded dict: the set of variable
+    names in use is small, and hits skip LRU bookkeeping.
+
+    Example:
+        >>> sym("x") is sym("x")
+        True
+    """
+    return sp.Symbol(name)
+
+
+def simplify(expr: sp.Basic) -> sp.Basic:
+    """Simplify an expression, memoizing on its structure.
+
+    Verifying the same claim shape repeatedly (as test suites do) produces
+    the same substituted formulas, and sp.simplify dominates their cost.
+    Boolean atoms are returned as they are, without a cache lookup.
+    """
+    if isinstance(expr, BooleanAtom):
+        return expr
+    return _simplify(expr)
+
+
+@functools.lru_cache(maxsize=4096)
+def _simplify(expr: sp.Basic) -> sp.Basic:
+    """The memoized sp.simplify behind simplify()."""
+    return sp.simplify(expr)
+
+
+def _sympify_value(value: Any) -> sp.Basic:
+    """Convert a bound value the way Basic.subs() does (strings are parsed)."""
+    return sp.sympify(value, strict=not isinstance(value, (str, type)))
+
+
+def substitute(expr: sp.Basic, bindings: Mapping[str, Any]) -> sp.Basic:
+    """Substitute values for the symbols with the given names.
+
+    All bindings are replaced in a single xreplace() traversal rather than
+    one subs() rebuild of the tree per binding. Only free symbols are
+    replaced: xreplace() would also rewrite the bound variables of sums
+    and integrals, leaving them with invalid limits.
+    """
+    free = expr.free_symbols
+    mapping: dict[sp.Symbol, sp.Basic] = {}
+    for name, value in bindings.items():
+        symbol = sym(name)
+        if symbol in free:
+            mapping[symbol] = _sympify_value(value)
+    return expr.xreplace(mapping)
+
+
+def decide(formula: sp.Basic) -> bool | None:
+    """Decide an already-concrete formula from its structure alone.
+
+    Substitution with concrete values usually leaves a Boolean atom or a
+    relation between two constants, which need no simplification.
+
+    Returns:
+        The truth value, or None if the formula needs simplifying first.
+    """
+    if formula is sp.true:
+        return True
+    if formula is sp.false:
+        return False
+
+    if not isinstance(formula, sp.Rel):
+        return None
+    lhs_val, rhs_val = formula.lhs, formula.rhs
+    if not (lhs_val.is_number and rhs_val.is_number):
+        return None
+
+    try:
+        if lhs_val.is_Number and rhs_val.is_Number:
+            # Two literal numbers: evaluating the relation is a plain compare
+            return bool(formula.func(lhs_val, rhs_val))
+        if isinstance(formula, (sp.Equality, sp.Ne)):
+            equal = lhs_val.equals(rhs_val)
+            if equal is None:
+                return None
+            return bool(equal) is isinstance(formula, sp.Equality)
+        # Rebuilding with evaluation on compares the two numbers directly
+        return bool(formula.func(lhs_val, rhs_val))
+    except (TypeError, ValueError, AttributeError):
+        return None
@@ -11,13 +11,104 @@ Each truth type knows how to construct its own falsification form.
 
 from __future__ import annotations
 
+import functools
+import operator
 from dataclasses import dataclass, field
+from itertools import repeat
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 import sympy as sp
+from sympy.logic.boolalg import BooleanAtom
+
+from .symbolic import decide, simplify, substitute, sym
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable, Mapping
+
+    Predicate = Callable[[Mapping[str, Any]], bool | None]
+    """A compiled formula: bindings to truth value, or None if undecidable."""
+
+
+def _cached_form(
+    build: Callable[[Any], FalsificationForm],
+) -> Callable[[Any], FalsificationForm]:
+    """Memoize a truth's falsify() on the (frozen) instance.
+
+    Truths are immutable, so their falsification form never changes; the
+    first call builds it and later calls return the same object.
+    """
+
+    @functools.wraps(build)
+    def falsify(self: Any) -> FalsificationForm:
+        form: FalsificationForm | None = self._form
+        if form is None:
+            form = build(self)
+            object.__setattr__(self, "_form", form)
+        return form
+
+    return falsify
+
+
+def _is_integer_polynomial(expr: sp.Basic) -> bool:
+    """Whether an expression is a polynomial with integer coefficients.
+
+    Division, constants such as pi and functions such as sin or log are
+    all excluded: Python evaluates them in floating point, not exactly.
+    """
+    if expr.is_Symbol or expr.is_Integer:
+        return True
+    if expr.is_Add or expr.is_Mul:
+        return all(_is_integer_polynomial(arg) for arg in expr.args)
+    if expr.is_Pow:
+        base, exponent = expr.args
+        return (
+            exponent.is_Integer
+            and not exponent.is_negative
+            and _is_integer_polynomial(base)
+        )
+    return False
+
+
+def _compile_relation(formula: sp.Basic) -> Predicate | None:
+    """Compile an integer polynomial relation to a predicate over bindings.
+
+    For plain int values, Python evaluates such relations exactly as
+    SymPy does; anything else makes the predicate return None.
+    """
+    if not isinstance(formula, sp.Rel):
+        return None
+    if not all(_is_integer_polynomial(side) for side in formula.args):
+        return None
+    # Bindings are matched to sym(name), as substitute() does; symbols with
+    # assumptions (or two symbols sharing a name) are left to SymPy
+    if not all(symbol == sym(symbol.name) for symbol in formula.free_symbols):
+        return None
+    return _lambdify_relation(formula)
+
+
+@functools.lru_cache(maxsize=2048)
+def _lambdify_relation(formula: sp.Rel) -> Predicate:
+    """Build the predicate for a compilable relation, shared across forms.
+
+    With integer constants only, equal formulas are structurally identical,
+    so forms of the same shape can safely share one generated function.
+    """
+    names = tuple(sorted(symbol.name for symbol in formula.free_symbols))
+    # cse factors repeated subexpressions out of the generated function
+    fn = sp.lambdify(
+        [sym(name) for name in names], formula, modules="math", cse=True
+    )
+
+    def predicate(bindings: Mapping[str, Any]) -> bool | None:
+        try:
+            values = [bindings[name] for name in names]
+            if not all(type(value) is int for value in values):
+                return None
+            return bool(fn(*values))
+        except (KeyError, NameError, ArithmeticError, TypeError, ValueError):
+            return None
+
+    return predicate
 
 
 @runtime_checkable
@@ -49,7 +140,7 @@ class Truth(Protocol):
         ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FalsificationForm:
     """A formula that, if satisfied, falsifies a claim.
 
@@ -64,11 +155,45 @@ class FalsificationForm:
     """The SymPy formula representing the falsification condition."""
 
     free_symbols: frozenset[sp.Symbol] = field(default_factory=frozenset)
-    """Symbols in the formula that require binding to concrete values."""
+    """Symbols requiring concrete values; the formula's own if left empty."""
 
     description: str = ""
     """Human-readable description of what satisfies this form."""
 
+    _compiled: tuple[Predicate | None] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Result of compile(), boxed so that "not compilable" is cached too."""
+
+    free_symbol_names: frozenset[str] = field(
+        init=False, repr=False, compare=False
+    )
+    """Names of the free symbols, computed once per form."""
+
+    def __post_init__(self) -> None:
+        if not self.free_symbols:
+            symbols = frozenset(self.formula.free_symbols)
+            object.__setattr__(self, "free_symbols", symbols)
+        names = frozenset(symbol.name for symbol in self.free_symbols)
+        object.__setattr__(self, "free_symbol_names", names)
+
+    def compile(self) -> Predicate | None:
+        """Compile the formula to a plain Python predicate, once per form.
+
+        Only polynomial relations with integer coefficients are compiled:
+        on int values their Python evaluation is exact, as SymPy's is.
+
+        Returns:
+            A function from bindings to the formula's truth value, which
+            returns None unless every bound value is a plain int;
+            or None if the formula cannot be compiled.
+        """
+        compiled = self._compiled
+        if compiled is None:
+            compiled = (_compile_relation(self.formula),)
+            object.__setattr__(self, "_compiled", compiled)
+        return compiled[0]
+
     def check(self, **bindings: Any) -> bool | None:
         """Check if the falsification condition is met with given bindings.
 
@@ -80,21 +205,44 @@ class FalsificationForm:
             False if condition is not met
             None if cannot be determined
         """
-        substituted = self.formula
-        for name, value in bindings.items():
-            symbol = sp.Symbol(name)
-            substituted = substituted.subs(symbol, value)
+        # Plain ints go through the compiled predicate, skipping SymPy
+        predicate = self.compile()
+        if predicate is not None:
+            decided = predicate(bindings)
+            if decided is not None:
+                return decided
+
+        substituted = substitute(self.formula, bindings)
+
+        # Concrete bindings usually leave a Boolean or a numeric relation
+        decided = decide(substituted)
+        if decided is not None:
+            return decided
 
-        simplified = sp.simplify(substituted)
+        simplified = simplify(substituted)
 
-        if simplified is sp.true or simplified == True:  # noqa: E712
-            return True
-        if simplified is sp.false or simplified == False:  # noqa: E712
-            return False
+        if isinstance(simplified, BooleanAtom):
+            return bool(simplified)
         return None
 
+    def check_batch(
+        self, bindings: Iterable[Mapping[str, Any]]
+    ) -> list[bool | None]:
+        """Check the falsification condition against many sets of bindings.
+
+        The formula is compiled once, on the first check, and reused for
+        every set of bindings after that.
+
+        Args:
+            bindings: Variable name to value mappings, one per check
+
+        Returns:
+            One check() result per mapping, in order.
+        """
+        return [self.check(**each) for each in bindings]
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Analytic:
     """An analytic truth: equality claims that can be falsified by counterexample.
 
@@ -127,28 +275,33 @@ class Analytic:
     var_name: str = "x"
     """Name for the free variable in the falsification form."""
 
+    _form: FalsificationForm | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Falsification form built on the first falsify() call."""
+
+    @_cached_form
     def falsify(self) -> FalsificationForm:
         """Construct falsification: ∃x: lhs ≠ rhs.
 
         Returns:
             FalsificationForm where satisfaction means finding inequality.
         """
-        lhs = sp.Symbol(self.lhs) if isinstance(self.lhs, str) else self.lhs
+        lhs = sym(self.lhs) if isinstance(self.lhs, str) else self.lhs
 
         # Falsification form: lhs ≠ rhs
         formula = sp.Ne(lhs, self.rhs)
 
         return FalsificationForm(
             formula=formula,
-            free_symbols=frozenset(formula.free_symbols),
             description=f"Find {self.var_name} where {lhs} ≠ {self.rhs}",
         )
 
     def __repr__(self) -> str:
-        return f"Analytic({self.statement!r})"
+        return f"{type(self).__name__}({self.statement!r})"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Modal:
     """A modal truth: necessity claims that can be falsified by possible violation.
 
@@ -175,6 +328,12 @@ class Modal:
     state_var: str = "state"
     """Name for the state variable in the falsification form."""
 
+    _form: FalsificationForm | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Falsification form built on the first falsify() call."""
+
+    @_cached_form
     def falsify(self) -> FalsificationForm:
         """Construct falsification: ◇¬P (possible violation).
 
@@ -186,15 +345,19 @@ class Modal:
 
         return FalsificationForm(
             formula=formula,
-            free_symbols=frozenset(formula.free_symbols),
             description=f"Find {self.state_var} where ¬({self.invariant})",
         )
 
     def __repr__(self) -> str:
-        return f"Modal({self.statement!r})"
+        return f"{type(self).__name__}({self.statement!r})"
+
 
+def _accept_any(value: Any) -> bool:
+    """Observation check for an Empirical claim without a predicate."""
+    return True  # No predicate means any observation is ok
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Empirical:
     """An empirical truth: observation-based claims.
 
@@ -225,13 +388,28 @@ class Empirical:
     contradiction_description: str = ""
     """Description of what would contradict this claim."""
 
+    _form: FalsificationForm | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Falsification form built on the first falsify() call."""
+
+    _check: Callable[[Any], bool] = field(init=False, repr=False, compare=False)
+    """The expected predicate, or one accepting anything, fixed once."""
+
+    def __post_init__(self) -> None:
+        check = self.expected_predicate
+        if check is None:
+            check = _accept_any
+        object.__setattr__(self, "_check", check)
+
+    @_cached_form
     def falsify(self) -> FalsificationForm:
         """Construct falsification: ∃obs: contradicts(obs).
 
         Returns:
             FalsificationForm where satisfaction means finding contradiction.
         """
-        var = sp.Symbol(self.observation_var)
+        var = sym(self.observation_var)
 
         # Create a symbolic contradiction predicate
         formula = sp.Function("Contradicts")(var)
@@ -240,7 +418,6 @@ class Empirical:
 
         return FalsificationForm(
             formula=formula,
-            free_symbols=frozenset(formula.free_symbols),
             description=desc,
         )
 
@@ -254,15 +431,32 @@ class Empirical:
             True if observation satisfies expected predicate
             False if observation contradicts (claim is KILLED)
         """
-        if self.expected_predicate is None:
-            return True  # No predicate means any observation is ok
-        return self.expected_predicate(value)
+        return self._check(value)
 
     def __repr__(self) -> str:
-        return f"Empirical({self.statement!r})"
+        return f"{type(self).__name__}({self.statement!r})"
+
+
+_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "=": operator.eq,
+}
+"""Python comparison for each Probabilistic direction."""
 
+_RELATIONS: dict[str, type[sp.Rel]] = {
+    ">": sp.StrictGreaterThan,
+    ">=": sp.GreaterThan,
+    "<": sp.StrictLessThan,
+    "<=": sp.LessThan,
+    "=": sp.Eq,
+}
+"""SymPy relation for each Probabilistic direction."""
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Probabilistic:
     """A probabilistic truth: threshold-based claims.
 
@@ -290,32 +484,37 @@ class Probabilistic:
     direction: str = ">"
     """Comparison direction: '>', '>=', '<', '<=', '='."""
 
+    _form: FalsificationForm | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Falsification form built on the first falsify() call."""
+
+    _compare: Callable[[Any, Any], bool] = field(
+        init=False, repr=False, compare=False
+    )
+    """Python comparison for the direction, looked up once."""
+
+    def __post_init__(self) -> None:
+        compare = _COMPARISONS.get(self.direction, operator.eq)
+        object.__setattr__(self, "_compare", compare)
+
+    @_cached_form
     def falsify(self) -> FalsificationForm:
         """Construct falsification: ∃metric: ¬(metric op threshold).
 
         Returns:
             FalsificationForm where satisfaction means threshold violation.
         """
-        var = sp.Symbol(self.metric)
-
-        # Construct the expected condition
-        if self.direction == ">":
-            expected = var > self.threshold
-        elif self.direction == ">=":
-            expected = var >= self.threshold
-        elif self.direction == "<":
-            expected = var < self.threshold
-        elif self.direction == "<=":
-            expected = var <= self.threshold
-        else:  # "="
-            expected = sp.Eq(var, self.threshold)
+        var = sym(self.metric)
+
+        # Construct the expected condition (unknown directions mean "=")
+        expected = _RELATIONS.get(self.direction, sp.Eq)(var, self.threshold)
 
         # Falsification: ¬(metric op threshold)
         formula = sp.Not(expected)
 
         return FalsificationForm(
             formula=formula,
-            free_symbols=frozenset(formula.free_symbols),
             description=f"Find {self.metric} where ¬({self.metric} {self.direction} {self.threshold})",
         )
 
@@ -329,16 +528,21 @@ class Probabilistic:
             True if value satisfies threshold
             False if threshold is violated (claim is KILLED)
         """
-        if self.direction == ">":
-            return value > self.threshold
-        elif self.direction == ">=":
-            return value >= self.threshold
-        elif self.direction == "<":
-            return value < self.threshold
-        elif self.direction == "<=":
-            return value <= self.threshold
-        else:  # "="
-            return value == self.threshold
+        return self._compare(value, self.threshold)
+
+    def check_threshold_batch(self, values: Iterable[float]) -> list[bool]:
+        """Check many values against the threshold.
+
+        Equivalent to calling check_threshold() on each value, without the
+        per-call method dispatch.
+
+        Args:
+            values: The measured values
+
+        Returns:
+            One check_threshold() result per value, in order.
+        """
+        return list(map(self._compare, values, repeat(self.threshold)))
 
     def __repr__(self) -> str:
-        return f"Probabilistic({self.statement!r})"
+        return f"{type(self).__name__}({self.statement!r})"
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
 import sympy as sp
+from sympy.core.cache import clear_cache
 
 from veritas import (
     Analytic,
@@ -14,6 +17,13 @@ from veritas import (
 )
 
 
+@pytest.fixture(autouse=True, scope="module")
+def _clear_sympy_cache() -> Iterator[None]:
+    """Clear SymPy's global cache after each test module to bound its growth."""
+    yield
+    clear_cache()
+
+
 @pytest.fixture
 def x() -> sp.Symbol:
     """A reusable symbol 'x'."""
@@ -17,6 +17,10 @@ class TestVerdict:
         assert Verdict.SURVIVED.value == "SURVIVED"
         assert Verdict.UNCERTAIN.value == "UNCERTAIN"
 
+    def test_str(self) -> None:
+        """str(Verdict) is the verdict's value."""
+        assert str(Verdict.KILLED) == "KILLED"
+
 
 class TestEvidence:
     """Tests for Evidence dataclass."""
@@ -78,3 +82,12 @@ class TestVerdictResult:
         r.add_trace("Step 1")
         r.add_trace("Step 2")
         assert r.trace == ["Step 1", "Step 2"]
+
+    def test_verdict_properties(self) -> None:
+        """survived, killed and uncertain reflect the verdict."""
+        survived = VerdictResult(verdict=Verdict.SURVIVED)
+        killed = VerdictResult(verdict=Verdict.KILLED)
+        uncertain = VerdictResult(verdict=Verdict.UNCERTAIN)
+        assert survived.survived and not survived.killed and not survived.uncertain
+        assert killed.killed and not killed.survived and not killed.uncertain
+        assert uncertain.uncertain and not uncertain.survived and not uncertain.killed
@@ -0,0 +1,82 @@
+"""Tests for the extract-claims skill script."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+pytest.importorskip("yaml")
+
+SCRIPT = (
+    Path(__file__).parent.parent
+    / ".claude/skills/extract-claims/scripts/extract.py"
+)
+
+
+def _load_extract() -> ModuleType:
+    """Import the script, which is not part of an installed package."""
+    spec = importlib.util.spec_from_file_location("extract", SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+extract = _load_extract()
+
+
+class TestIterClaims:
+    """Tests for iter_claims()."""
+
+    def test_line_numbers(self, tmp_path: Path) -> None:
+        """Claims point at the line they were found on."""
+        (tmp_path / "a.py").write_bytes(b"x = 1\n# TODO: fix this\ny = 2\n")
+        claims = list(extract.iter_claims(tmp_path))
+        assert [c["source_file"] for c in claims] == ["a.py:2"]
+        assert claims[0]["statement"] == "TODO: fix this"
+
+    def test_carriage_return_line_breaks(self, tmp_path: Path) -> None:
+        """CR-only files are split into lines like str.splitlines()."""
+        (tmp_path / "a.py").write_bytes(b"x = 1\r# TODO: fix this\ry=2")
+        claims = list(extract.iter_claims(tmp_path))
+        assert [c["source_file"] for c in claims] == ["a.py:2"]
+        assert claims[0]["source_text"] == "# TODO: fix this"
+
+    def test_non_ascii_whitespace(self, tmp_path: Path) -> None:
+        """Lines matched only through Unicode whitespace are still found."""
+        source = "x = 1\n#\xa0TODO fix this\n# TODO: and this\n"
+        (tmp_path / "a.py").write_text(source, encoding="utf-8")
+        claims = list(extract.iter_claims(tmp_path))
+        assert [c["source_file"] for c in claims] == ["a.py:2", "a.py:3"]
+        assert [c["id"] for c in claims] == ["001", "002"]
+
+
+class TestWriteClaimsFile:
+    """Tests for _write_claims_file()."""
+
+    def test_writes_claims(self, tmp_path: Path) -> None:
+        """The claims YAML replaces the output file."""
+        (tmp_path / "a.py").write_text("# TODO: fix this\n")
+        output = tmp_path / "claims.yaml"
+        output.write_text("old\n")
+        assert extract._write_claims_file(tmp_path, str(output)) == 1
+        assert "TODO: fix this" in output.read_text()
+
+    def test_failure_keeps_previous_output(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed scan leaves the old output and no temporary file."""
+
+        def fail(path: Path, out: object) -> int:
+            raise RuntimeError("scan failed")
+
+        output = tmp_path / "claims.yaml"
+        output.write_text("old\n")
+        monkeypatch.setattr(extract, "write_claims", fail)
+        with pytest.raises(RuntimeError):
+            extract._write_claims_file(tmp_path, str(output))
+        assert output.read_text() == "old\n"
+        assert list(tmp_path.iterdir()) == [output]
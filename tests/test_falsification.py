@@ -6,9 +6,13 @@ import sympy as sp
 
 from veritas import (
     Analytic,
+    Empirical,
     Evidence,
+    Modal,
+    Probabilistic,
     Verdict,
     falsify,
+    falsify_batch,
     quick_check,
 )
 from veritas.falsification import _evaluate, _substitute
@@ -39,12 +43,34 @@ class TestEvaluate:
         expr = sp.Ne(4, 4)
         assert _evaluate(expr) is False
 
+    def test_unevaluated_concrete_relation(self) -> None:
+        """_evaluate() decides relations between constants."""
+        expr = sp.Ne(sp.pi, 3, evaluate=False)
+        assert _evaluate(expr) is True
+
+    def test_unevaluated_numeric_inequality(self) -> None:
+        """_evaluate() decides inequalities between numeric expressions."""
+        expr = sp.Lt(sp.sqrt(2), 2, evaluate=False)
+        assert _evaluate(expr) is True
+
+    def test_unevaluated_integral(self) -> None:
+        """_evaluate() evaluates integrals before comparing."""
+        t = sp.Symbol("t")
+        expr = sp.Ne(sp.Integral(2 * t, (t, 0, 2)), 4)
+        assert _evaluate(expr) is False
+
     def test_symbolic_returns_none(self) -> None:
         """_evaluate() returns None for symbolic expression."""
         x = sp.Symbol("x")
         expr = sp.Ne(x, 4)
         assert _evaluate(expr) is None
 
+    def test_symbolic_conjunction_returns_none(self) -> None:
+        """_evaluate() does not treat a symbolic conjunction as true."""
+        x = sp.Symbol("x")
+        expr = sp.And(x > 0, x < 1)
+        assert _evaluate(expr) is None
+
 
 class TestFalsify:
     """Tests for falsify()."""
@@ -71,6 +97,105 @@ class TestFalsify:
         assert result.verdict == Verdict.UNCERTAIN
         assert "Missing" in result.reasoning
 
+    def test_mixed_numeric_types(self) -> None:
+        """falsify() compares int and float evidence numerically."""
+        truth = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        survived = falsify(truth, Evidence(bindings={"result": 4.0}))
+        killed = falsify(truth, Evidence(bindings={"result": 4.5}))
+        assert survived.verdict == Verdict.SURVIVED
+        assert killed.verdict == Verdict.KILLED
+
+    def test_sympy_evidence(self) -> None:
+        """falsify() compares SymPy evidence values numerically."""
+        truth = Analytic(statement="sqrt(2)**2 = 2", lhs="result", rhs=2)
+        evidence = Evidence(bindings={"result": sp.sqrt(2) ** 2})
+        assert falsify(truth, evidence).verdict == Verdict.SURVIVED
+
+    def test_modal_invariant(self) -> None:
+        """falsify() checks Modal invariants against numeric state."""
+        x = sp.Symbol("x")
+        truth = Modal(statement="x is non-negative", invariant=x >= 0)
+        killed = falsify(truth, Evidence(bindings={"x": -1}))
+        survived = falsify(truth, Evidence(bindings={"x": 2.5}))
+        assert killed.verdict == Verdict.KILLED
+        assert survived.verdict == Verdict.SURVIVED
+
+    def test_modal_invariant_with_rational(self) -> None:
+        """falsify() keeps SymPy's exact arithmetic for rational constants."""
+        x = sp.Symbol("x")
+        truth = Modal(statement="x/3 is 1/3", invariant=sp.Eq(x / 3, sp.Rational(1, 3)))
+        result = falsify(truth, Evidence(bindings={"x": 1}))
+        assert result.verdict == Verdict.SURVIVED
+
+    def test_modal_invariant_non_polynomial(self) -> None:
+        """falsify() agrees with SymPy on division, pi and logarithms."""
+        x, y, z = sp.Symbol("x"), sp.Symbol("y"), sp.Symbol("z")
+        cases = [
+            (sp.Eq(sp.sin(sp.pi * x), 0), {"x": 1}),
+            (sp.Ne(x / y, z), {"x": 10**17 + 1, "y": 1, "z": 10**17}),
+            (sp.Eq(sp.log(x, 10), 3), {"x": 1000}),
+        ]
+        for invariant, bindings in cases:
+            truth = Modal(statement=str(invariant), invariant=invariant)
+            result = falsify(truth, Evidence(bindings=bindings))
+            assert result.verdict == Verdict.SURVIVED, invariant
+
+    def test_modal_invariant_symbol_with_assumptions(self) -> None:
+        """falsify() treats int and float state alike for assumed symbols."""
+        x = sp.Symbol("x", positive=True)
+        truth = Modal(statement="x is 3", invariant=sp.Eq(x, 3))
+        as_int = falsify(truth, Evidence(bindings={"x": 3}))
+        as_float = falsify(truth, Evidence(bindings={"x": 3.0}))
+        assert as_int.verdict == as_float.verdict == Verdict.UNCERTAIN
+
+    def test_binding_named_like_bound_variable(self) -> None:
+        """falsify() leaves bound variables alone when a binding shares the name."""
+        k, n, x = sp.Symbol("k"), sp.Symbol("n"), sp.Symbol("x")
+        cases = [
+            (sp.Eq(sp.Sum(k, (k, 1, n)), n * (n + 1) / 2), {"n": 4, "k": 2}),
+            (sp.Eq(sp.Integral(x, (x, 0, 1)), sp.Rational(1, 2)), {"x": 3}),
+        ]
+        for invariant, bindings in cases:
+            truth = Modal(statement=str(invariant), invariant=invariant)
+            result = falsify(truth, Evidence(bindings=bindings))
+            assert result.verdict == Verdict.SURVIVED, invariant
+
+    def test_probabilistic_threshold(self) -> None:
+        """falsify() checks Probabilistic thresholds against the metric."""
+        truth = Probabilistic(statement="acc > 0.5", metric="acc", threshold=0.5)
+        killed = falsify(truth, Evidence(bindings={"acc": 0.5}))
+        survived = falsify(truth, Evidence(bindings={"acc": 0.75}))
+        assert killed.verdict == Verdict.KILLED
+        assert survived.verdict == Verdict.SURVIVED
+
+    def test_empirical_predicate(self) -> None:
+        """falsify() applies an Empirical predicate to the observation."""
+        truth = Empirical(
+            statement="API returns 200",
+            observation_var="status",
+            expected_predicate=lambda s: s == 200,
+        )
+        killed = falsify(truth, Evidence(bindings={"status": 404}))
+        survived = falsify(truth, Evidence(bindings={"status": 200}))
+        assert killed.verdict == Verdict.KILLED
+        assert survived.verdict == Verdict.SURVIVED
+
+    def test_empirical_predicate_error(self) -> None:
+        """falsify() reports UNCERTAIN when the predicate raises."""
+        truth = Empirical(
+            statement="API returns 200",
+            observation_var="status",
+            expected_predicate=lambda s: s["code"] == 200,
+        )
+        result = falsify(truth, Evidence(bindings={"status": 5}))
+        assert result.verdict == Verdict.UNCERTAIN
+
+    def test_empirical_without_predicate(self) -> None:
+        """falsify() cannot decide an Empirical claim without a predicate."""
+        truth = Empirical(statement="API works", observation_var="status")
+        result = falsify(truth, Evidence(bindings={"status": 200}))
+        assert result.verdict == Verdict.UNCERTAIN
+
     def test_populates_trace(self) -> None:
         """falsify() populates the trace."""
         truth = Analytic(statement="test", lhs="result", rhs=4)
@@ -78,6 +203,29 @@ class TestFalsify:
         result = falsify(truth, evidence)
         assert len(result.trace) > 0
 
+    def test_analytic_form_without_lhs_symbol(self) -> None:
+        """falsify() handles forms that collapse without the lhs symbol."""
+        truth = Analytic(statement="r is a set", lhs="r", rhs=sp.FiniteSet(1, 2))
+        assert truth.falsify().free_symbols == frozenset()
+        assert falsify(truth, Evidence(bindings={})).verdict == Verdict.KILLED
+        assert quick_check(truth, other=1) == Verdict.KILLED
+
+    def test_trace_direct_evaluation(self) -> None:
+        """falsify() does not trace a substitution it never performed."""
+        truth = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        result = falsify(truth, Evidence(bindings={"result": 4}))
+        assert not any(step.startswith("Substituted") for step in result.trace)
+        assert "Evaluated bindings directly, without substitution" in result.trace
+
+    def test_trace_disabled(self) -> None:
+        """falsify(trace=False) leaves the trace empty but keeps the verdict."""
+        truth = Analytic(statement="test", lhs="result", rhs=4)
+        evidence = Evidence(bindings={"result": 5})
+        result = falsify(truth, evidence, trace=False)
+        assert result.verdict == Verdict.KILLED
+        assert result.trace == []
+        assert result.reasoning
+
     def test_sets_form_and_evidence(self) -> None:
         """falsify() sets form and evidence on result."""
         truth = Analytic(statement="test", lhs="result", rhs=4)
@@ -87,6 +235,35 @@ class TestFalsify:
         assert result.evidence is evidence
 
 
+class TestFalsifyBatch:
+    """Tests for falsify_batch()."""
+
+    def test_verdicts_in_order(self) -> None:
+        """falsify_batch() returns one result per evidence, in order."""
+        truth = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        evidences = [
+            Evidence(bindings={"result": 4}),
+            Evidence(bindings={"result": 5}),
+            Evidence(bindings={}),
+        ]
+        results = falsify_batch(truth, evidences)
+        assert [r.verdict for r in results] == [
+            Verdict.SURVIVED,
+            Verdict.KILLED,
+            Verdict.UNCERTAIN,
+        ]
+
+    def test_matches_falsify(self) -> None:
+        """falsify_batch() agrees with falsify() on each evidence."""
+        truth = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        evidence = Evidence(bindings={"result": 4})
+        (batched,) = falsify_batch(truth, [evidence])
+        single = falsify(truth, evidence)
+        assert batched.verdict == single.verdict
+        assert batched.trace == single.trace
+        assert batched.evidence is evidence
+
+
 class TestQuickCheck:
     """Tests for quick_check()."""
 
@@ -118,6 +118,29 @@ class TestVerifiedDecorator:
         result = test_multiply()
         assert result.verdict == Verdict.SURVIVED
 
+    def test_verified_caches_truth(self) -> None:
+        """@verified builds the truth once unless told not to."""
+        calls: list[int] = []
+
+        def factory() -> Analytic:
+            calls.append(1)
+            return Analytic("multiply", lhs="result", rhs=6)
+
+        @verified(factory)
+        def test_cached() -> int:
+            return 2 * 3
+
+        @verified(factory, cache_truth=False)
+        def test_uncached() -> int:
+            return 2 * 3
+
+        test_cached()
+        test_cached()
+        assert len(calls) == 1
+        test_uncached()
+        test_uncached()
+        assert len(calls) == 3
+
 
 class TestEmpiricalWorkflow:
     """Integration tests for Empirical claims."""
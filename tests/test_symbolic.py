@@ -0,0 +1,58 @@
+"""Tests for veritas.symbolic module."""
+
+from __future__ import annotations
+
+import sympy as sp
+
+from veritas import sym
+from veritas.symbolic import decide, simplify, substitute
+
+
+class TestSym:
+    """Tests for sym()."""
+
+    def test_returns_symbol(self) -> None:
+        """sym() returns a SymPy symbol with the given name."""
+        assert sym("x") == sp.Symbol("x")
+
+    def test_caching(self) -> None:
+        """sym() returns the same object for the same name."""
+        assert sym("x") is sym("x")
+
+
+class TestSimplify:
+    """Tests for simplify()."""
+
+    def test_matches_sympy(self) -> None:
+        """simplify() agrees with sp.simplify."""
+        x = sym("x")
+        expr = sp.Ne(x + x, 2 * x)
+        assert simplify(expr) == sp.simplify(expr)
+
+    def test_boolean_atom(self) -> None:
+        """simplify() returns Boolean atoms unchanged."""
+        assert simplify(sp.true) is sp.true
+        assert simplify(sp.false) is sp.false
+
+
+class TestSubstitute:
+    """Tests for substitute()."""
+
+    def test_matches_subs(self) -> None:
+        """substitute() agrees with iterated subs()."""
+        x, y = sym("x"), sym("y")
+        expr = sp.Ne(x + y, 3)
+        assert substitute(expr, {"x": 1, "y": "2"}) == expr.subs(x, 1).subs(y, 2)
+
+
+class TestDecide:
+    """Tests for decide()."""
+
+    def test_numeric_relation(self) -> None:
+        """decide() evaluates relations between numbers without simplifying."""
+        assert decide(sp.Ne(sp.sqrt(2), 1, evaluate=False)) is True
+        assert decide(sp.Lt(3, 2, evaluate=False)) is False
+
+    def test_symbolic_returns_none(self) -> None:
+        """decide() leaves formulas with free symbols undecided."""
+        assert decide(sp.Ne(sym("x"), 1)) is None
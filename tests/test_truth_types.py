@@ -63,6 +63,110 @@ class TestFalsificationForm:
         result = form.check(x=4)
         assert result is False
 
+    def test_check_batch(self) -> None:
+        """check_batch() matches check() per set of bindings."""
+        form = FalsificationForm(formula=sp.Ne(sp.Symbol("x"), 4))
+        assert form.check_batch([{"x": 5}, {"x": 4}, {}]) == [True, False, None]
+
+    def test_free_symbol_names(self) -> None:
+        """free_symbol_names holds the names of the free symbols."""
+        form = FalsificationForm(
+            formula=sp.Ne(sp.Symbol("x"), sp.Symbol("y")),
+            free_symbols=frozenset({sp.Symbol("x"), sp.Symbol("y")}),
+        )
+        assert form.free_symbol_names == frozenset({"x", "y"})
+
+    def test_free_symbols_default(self) -> None:
+        """free_symbols defaults to the formula's free symbols."""
+        form = FalsificationForm(formula=sp.Ne(sp.Symbol("x"), 4))
+        assert form.free_symbols == frozenset({sp.Symbol("x")})
+        assert form.free_symbol_names == frozenset({"x"})
+
+    def test_compile(self) -> None:
+        """compile() returns a predicate over bindings, built once."""
+        form = FalsificationForm(
+            formula=sp.Ne(sp.Symbol("x"), 4),
+            free_symbols=frozenset({sp.Symbol("x")}),
+        )
+        predicate = form.compile()
+        assert predicate is not None
+        assert predicate({"x": 5}) is True
+        assert predicate({"x": 4}) is False
+        assert predicate({"x": "4"}) is None
+        assert form.compile() is predicate
+
+    def test_compile_repeated_subexpression(self) -> None:
+        """compile() handles formulas with repeated subexpressions."""
+        x, y = sp.Symbol("x"), sp.Symbol("y")
+        form = FalsificationForm(formula=sp.Lt((x + y) ** 2, (x + y) * 3))
+        predicate = form.compile()
+        assert predicate is not None
+        assert predicate({"x": 1, "y": 1}) is True
+        assert predicate({"x": 2, "y": 2}) is False
+
+    def test_compile_symbols_with_assumptions(self) -> None:
+        """compile() leaves symbols other than sym(name) to SymPy."""
+        x, positive_x = sp.Symbol("x"), sp.Symbol("x", positive=True)
+        same_name = FalsificationForm(formula=sp.Ne(x, positive_x))
+        assert same_name.compile() is None
+        assert same_name.check(x=1) is None
+        assumed = FalsificationForm(formula=sp.Ne(positive_x, 3))
+        assert assumed.compile() is None
+        assert assumed.check(x=3) == assumed.check(x=3.0)
+
+    def test_check_non_polynomial_matches_sympy(self) -> None:
+        """check() agrees with the symbolic path on non-polynomial formulas."""
+        x, y = sp.Symbol("x"), sp.Symbol("y")
+        cases = [
+            (sp.Ne(sp.sin(sp.pi * x), 0), {"x": 1}),
+            (sp.Eq(x / y, 10**17), {"x": 10**17 + 1, "y": 1}),
+            (sp.Ne(sp.log(x, 10), 3), {"x": 1000}),
+        ]
+        for formula, bindings in cases:
+            form = FalsificationForm(formula=formula)
+            # Exactly, none of these falsification conditions holds
+            assert form.check(**bindings) is False, formula
+
+    def test_check_binding_named_like_bound_variable(self) -> None:
+        """check() ignores bindings that only name a bound variable."""
+        k, n = sp.Symbol("k"), sp.Symbol("n")
+        form = FalsificationForm(formula=sp.Ne(sp.Sum(k, (k, 1, n)), 10))
+        assert form.check(n=4, k=2) is False
+
+    def test_check_falls_back_to_sympy(self) -> None:
+        """check() agrees with SymPy for values the predicate rejects."""
+        form = FalsificationForm(formula=sp.Ne(sp.Symbol("x"), 4))
+        assert form.check(x=sp.Rational(8, 2)) is False
+        assert form.check(x=sp.Rational(9, 2)) is True
+
+    def test_compile_shared_across_forms(self) -> None:
+        """compile() reuses the predicate of an equal formula."""
+        first = FalsificationForm(formula=sp.Ne(sp.Symbol("x"), 4))
+        second = FalsificationForm(formula=sp.Ne(sp.Symbol("x"), 4))
+        assert first.compile() is second.compile()
+
+    def test_compile_non_relation(self) -> None:
+        """compile() returns None for formulas it cannot compile."""
+        form = FalsificationForm(formula=sp.Function("Contradicts")(sp.Symbol("x")))
+        assert form.compile() is None
+
+    def test_compile_undefined_function(self) -> None:
+        """compile() skips relations involving undefined functions."""
+        f = sp.Function("f")
+        form = FalsificationForm(formula=sp.Ne(f(sp.Symbol("x")), 1))
+        assert form.compile() is None
+
+    def test_compile_non_polynomial(self) -> None:
+        """compile() skips division, constants like pi and functions."""
+        x, y = sp.Symbol("x"), sp.Symbol("y")
+        for formula in [
+            sp.Eq(sp.sin(sp.pi * x), 0),
+            sp.Ne(x / y, 1),
+            sp.Eq(sp.log(x, 10), 3),
+            sp.Lt(sp.sqrt(x), 2),
+        ]:
+            assert FalsificationForm(formula=formula).compile() is None, formula
+
 
 class TestAnalytic:
     """Tests for Analytic truth type."""
@@ -87,12 +191,33 @@ class TestAnalytic:
         result = form.check(result=4)
         assert result is False
 
+    def test_falsify_is_memoized(self) -> None:
+        """falsify() returns the same form on repeated calls."""
+        t = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        assert t.falsify() is t.falsify()
+
+    def test_cached_form_ignored_by_equality(self) -> None:
+        """The cached form does not affect equality or hashing."""
+        a = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        b = Analytic(statement="2+2=4", lhs="result", rhs=4)
+        a.falsify()
+        assert a == b
+        assert hash(a) == hash(b)
+
     def test_repr(self) -> None:
         """__repr__ returns useful string."""
         t = Analytic(statement="test", lhs="x", rhs=1)
         assert "Analytic" in repr(t)
         assert "test" in repr(t)
 
+    def test_repr_uses_subclass_name(self) -> None:
+        """__repr__ names the concrete class."""
+
+        class Equality(Analytic):
+            pass
+
+        assert repr(Equality(statement="test", lhs="x", rhs=1)) == "Equality('test')"
+
 
 class TestModal:
     """Tests for Modal truth type."""
@@ -199,6 +324,12 @@ class TestProbabilistic:
         assert t.check_threshold(0.5) is True
         assert t.check_threshold(0.6) is False
 
+    def test_check_threshold_batch(self) -> None:
+        """check_threshold_batch() matches check_threshold() per value."""
+        t = Probabilistic(statement="test", metric="acc", threshold=0.5, direction=">=")
+        values = [0.4, 0.5, 0.6]
+        assert t.check_threshold_batch(values) == [t.check_threshold(v) for v in values]
+
     def test_repr(self) -> None:
         """__repr__ returns useful string."""
         t = Probabilistic(statement="test", metric="acc", threshold=0.5)